@@ -4,4 +4,20 @@
 Package untuk komponen aplikasi MLOps MidExam.
 """
 
-from .prediction import load_model, model_page
+import importlib
+
+# Re-exports are resolved lazily so that importing ``deployment.eda`` (the
+# default page) does not pull in the model-loading stack of ``prediction``.
+_LAZY_EXPORTS = {
+    "load_model": ".prediction",
+    "model_page": ".prediction",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,10 +1,7 @@
-﻿from pathlib import Path
-
-import pandas as pd
+﻿import pandas as pd
 import streamlit as st
 
-from deployment.eda import eda_page
-from deployment.prediction import model_page
+from deployment.data import load_data
 
 st.set_page_config(
     page_title="Shipping Service Monitor",
@@ -12,14 +9,6 @@ st.set_page_config(
     layout="wide",
 )
 
-BASE_DIR = Path(__file__).resolve().parent
-
-
-@st.cache_data(show_spinner=False)
-def load_data() -> pd.DataFrame:
-    """Read the dataset packaged with the deployment bundle."""
-    return pd.read_csv(BASE_DIR / "shipping.csv")
-
 
 def render_overview(data: pd.DataFrame) -> None:
     st.title("Shipping Service Monitor")
@@ -45,6 +34,12 @@ def render_overview(data: pd.DataFrame) -> None:
 
 
 def main() -> None:
+    from deployment.prediction import warm_model
+
+    # Load the model in the background while the overview renders, so the
+    # first prediction does not wait for the download.
+    warm_model()
+
     data = load_data()
     render_overview(data)
 
@@ -55,9 +50,16 @@ def main() -> None:
         index=0,
     )
 
+    # Page modules are imported on demand, so plotly is only loaded for the EDA
+    # page. joblib, sklearn and huggingface_hub are loaded for every session by
+    # the background warm-up above, off the script thread.
     if selected_option == "Data Analysis":
+        from deployment.eda import eda_page
+
         eda_page(data)
     else:
+        from deployment.prediction import model_page
+
         model_page(data)
 
 
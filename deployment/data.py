@@ -0,0 +1,29 @@
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+
+BASE_DIR = Path(__file__).resolve().parent
+DATA_PATH = BASE_DIR / "shipping.csv"
+
+# Compact dtypes for the shipping dataset: low-cardinality strings become
+# categoricals and integers use the smallest type that fits their range.
+DATA_DTYPES = {
+    "Warehouse_block": "category",
+    "Mode_of_Shipment": "category",
+    "Product_importance": pd.CategoricalDtype(["low", "medium", "high"], ordered=True),
+    "Gender": "category",
+    "Customer_care_calls": "int8",
+    "Customer_rating": "int8",
+    "Prior_purchases": "int8",
+    "Discount_offered": "int16",
+    "Cost_of_the_Product": "int32",
+    "Weight_in_gms": "int32",
+    "Reached.on.Time_Y.N": "int8",
+}
+
+
+@st.cache_data(show_spinner=False)
+def load_data() -> pd.DataFrame:
+    """Read the dataset packaged with the deployment bundle."""
+    return pd.read_csv(DATA_PATH, engine="pyarrow", dtype=DATA_DTYPES)
@@ -1,18 +1,58 @@
+from typing import TYPE_CHECKING
+
 import numpy as np
 import pandas as pd
-import plotly.express as px
 import streamlit as st
 
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
 TARGET_COLUMN = "Reached.on.Time_Y.N"
 TARGET_LABELS = {1: "On Time", 0: "Late"}
+SEGMENT_COLUMNS = ["Mode_of_Shipment", "Warehouse_block", "Product_importance", "Gender"]
+
 
+def _label_target(data: pd.DataFrame, column: str = TARGET_COLUMN) -> pd.Series:
+    """Label the binary target as a compact categorical Series."""
+    values = data[column].to_numpy()
+    known = (values == 0) | (values == 1)
+    codes = np.where(known, values, 2).astype(np.int8)
 
-def _label_target(series: pd.Series) -> pd.Series:
-    return series.map(TARGET_LABELS).fillna("Unknown")
+    categories = [TARGET_LABELS[0], TARGET_LABELS[1]]
+    if not known.all():
+        categories.append("Unknown")
+
+    return pd.Series(
+        pd.Categorical.from_codes(codes, categories=categories),
+        index=data.index,
+        name=column,
+    )
+
+
+def _target_counts(labels: pd.Series) -> pd.DataFrame:
+    """Count and share per status with a single bincount over the label codes."""
+    categories = labels.cat.categories
+    counts = np.bincount(labels.cat.codes.to_numpy(), minlength=len(categories))
+    target_counts = pd.DataFrame(
+        {
+            "Status": categories,
+            "Count": counts,
+            "Percentage": counts / counts.sum() * 100,
+        }
+    )
+    return (
+        target_counts[target_counts["Count"] > 0]
+        .sort_values("Count", ascending=False)
+        .reset_index(drop=True)
+    )
 
 
 def _get_categorical_columns(data: pd.DataFrame) -> list[str]:
-    return data.select_dtypes(include=["object"]).columns.tolist()
+    return [
+        column
+        for column, dtype in data.dtypes.items()
+        if str(dtype) in ("object", "str", "category")
+    ]
 
 
 def _get_numeric_columns(data: pd.DataFrame) -> list[str]:
@@ -30,15 +70,144 @@ def _get_numeric_columns(data: pd.DataFrame) -> list[str]:
 
 def _make_numeric_bins(series: pd.Series, n_bins: int = 5) -> pd.Categorical:
     """Create human-friendly ranges like '0–1000' instead of raw numbers."""
+    values = series.to_numpy(dtype=np.float64)
+    missing = np.isnan(values)
     min_v = float(series.min())
     max_v = float(series.max())
 
     if min_v == max_v:
-        return pd.cut(series, bins=[min_v - 1, max_v + 1], labels=[f"{min_v:.0f}"])
+        codes = np.where(missing, -1, 0).astype(np.int8)
+        return pd.Categorical.from_codes(codes, categories=[f"{min_v:.0f}"])
 
     bins = np.linspace(min_v, max_v, n_bins + 1)
     labels = [f"{bins[i]:.0f}–{bins[i+1]:.0f}" for i in range(len(bins) - 1)]
-    return pd.cut(series, bins=bins, labels=labels, include_lowest=True)
+
+    # Right-closed intervals with the lowest edge included, same as pd.cut.
+    codes = np.clip(np.searchsorted(bins, values, side="left") - 1, 0, n_bins - 1)
+    codes = np.where(missing, -1, codes).astype(np.int8)
+    return pd.Categorical.from_codes(codes, categories=labels)
+
+
+@st.cache_data(show_spinner=False)
+def _category_summary(data: pd.DataFrame, column: str) -> pd.DataFrame:
+    """On-time rate and shipment count for each value of a categorical column."""
+    summary = (
+        data.groupby(column, observed=True)
+        .agg(on_time_percent=(TARGET_COLUMN, "mean"))
+        .reset_index()
+    )
+    summary["on_time_percent"] *= 100
+
+    counts = data[column].value_counts(dropna=False, sort=False)
+    summary["total_shipments"] = counts.reindex(summary[column]).to_numpy()
+    return summary
+
+
+@st.cache_data(show_spinner=False)
+def _numeric_bin_summary(data: pd.DataFrame, column: str, n_bins: int = 5) -> pd.DataFrame:
+    """On-time rate and shipment count for each value range of a numeric column."""
+    binned = pd.DataFrame(
+        {
+            "range": _make_numeric_bins(data[column], n_bins),
+            TARGET_COLUMN: data[TARGET_COLUMN].to_numpy(),
+        }
+    )
+
+    summary = (
+        binned.groupby("range", observed=True)
+        .agg(
+            on_time_percent=(TARGET_COLUMN, "mean"),
+            total_shipments=(TARGET_COLUMN, "size"),
+        )
+        .reset_index()
+        .dropna()
+    )
+    summary["on_time_percent"] *= 100
+    return summary
+
+
+@st.cache_data(show_spinner=False)
+def _all_segment_summaries(data: pd.DataFrame) -> dict[str, pd.DataFrame]:
+    """On-time rate, average cost and average discount for every segment column."""
+    summaries = {}
+    for column in SEGMENT_COLUMNS:
+        summary = (
+            data.groupby(column, observed=True)
+            .agg(
+                on_time_percent=(TARGET_COLUMN, "mean"),
+                avg_cost=("Cost_of_the_Product", "mean"),
+                avg_discount=("Discount_offered", "mean"),
+            )
+            .reset_index()
+        )
+        summary["on_time_percent"] *= 100
+        summaries[column] = summary
+    return summaries
+
+
+@st.cache_resource(show_spinner=False)
+def _build_target_fig(target_counts: pd.DataFrame) -> "go.Figure":
+    import plotly.graph_objects as go
+
+    return go.Figure(
+        go.Pie(
+            labels=target_counts["Status"].tolist(),
+            values=target_counts["Count"].tolist(),
+            hole=0.35,
+            textposition="inside",
+            textinfo="percent+label",
+        )
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def _build_category_fig(summary: pd.DataFrame, column: str) -> "go.Figure":
+    import plotly.express as px
+
+    return px.bar(
+        summary,
+        x=column,
+        y="on_time_percent",
+        text_auto=".1f",
+        labels={
+            "on_time_percent": "On-time delivery rate (%)",
+            "total_shipments": "Number of shipments",
+        },
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def _build_numeric_fig(summary: pd.DataFrame, column: str) -> "go.Figure":
+    import plotly.express as px
+
+    return px.bar(
+        summary,
+        x="range",
+        y="on_time_percent",
+        text_auto=".1f",
+        labels={
+            "range": f"{column} range",
+            "on_time_percent": "On-time delivery rate (%)",
+        },
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def _build_segment_fig(summary: pd.DataFrame, column: str) -> "go.Figure":
+    import plotly.express as px
+
+    return px.bar(
+        summary,
+        x=column,
+        y="on_time_percent",
+        text_auto=".1f",
+        color="avg_discount",
+        color_continuous_scale="Blues",
+        labels={
+            "on_time_percent": "On-time delivery rate (%)",
+            "avg_discount": "Average discount",
+        },
+    )
 
 
 def eda_page(data: pd.DataFrame) -> None:
@@ -48,7 +217,6 @@ def eda_page(data: pd.DataFrame) -> None:
     on_time_rate = data[TARGET_COLUMN].mean() * 100
 
     median_discount = data["Discount_offered"].median()
-    median_weight = data["Weight_in_gms"].median()
     loyal_share = (data["Prior_purchases"] > 3).mean() * 100
 
     c1, c2, c3, c4 = st.columns(4)
@@ -62,6 +230,8 @@ def eda_page(data: pd.DataFrame) -> None:
         "and how generous you are with discounts and loyal customers."
     )
 
+    target_labels = _label_target(data)
+
     tab_target, tab_category, tab_numeric, tab_segments = st.tabs(
         ["Delivery status", "By category", "By numeric feature", "Business segments"]
     )
@@ -69,21 +239,9 @@ def eda_page(data: pd.DataFrame) -> None:
     with tab_target:
         st.subheader("Overall delivery status")
 
-        target_series = _label_target(data[TARGET_COLUMN])
-        target_counts = (
-            target_series.value_counts().rename_axis("Status").reset_index(name="Count")
-        )
-        target_counts["Percentage"] = (
-            target_counts["Count"] / target_counts["Count"].sum() * 100
-        )
+        target_counts = _target_counts(target_labels)
 
-        fig = px.pie(
-            target_counts,
-            values="Count",
-            names="Status",
-            hole=0.35,
-        )
-        fig.update_traces(textposition="inside", textinfo="percent+label")
+        fig = _build_target_fig(target_counts)
         st.plotly_chart(fig, use_container_width=True)
 
         late_row = target_counts.loc[target_counts["Status"] == "Late"]
@@ -107,25 +265,9 @@ def eda_page(data: pd.DataFrame) -> None:
             )
 
             # Instead of 100% bars, show on-time rate per category
-            summary = (
-                data.groupby(selected_cat)
-                .agg(
-                    on_time_percent=(TARGET_COLUMN, lambda x: x.mean() * 100),
-                    total_shipments=(TARGET_COLUMN, "size"),
-                )
-                .reset_index()
-            )
+            summary = _category_summary(data, selected_cat)
 
-            fig_cat = px.bar(
-                summary,
-                x=selected_cat,
-                y="on_time_percent",
-                text_auto=".1f",
-                labels={
-                    "on_time_percent": "On-time delivery rate (%)",
-                    "total_shipments": "Number of shipments",
-                },
-            )
+            fig_cat = _build_category_fig(summary, selected_cat)
             st.plotly_chart(fig_cat, use_container_width=True)
 
             st.caption(
@@ -157,30 +299,9 @@ def eda_page(data: pd.DataFrame) -> None:
             )
 
             # Convert numeric values into simple ranges (bins)
-            binned = _make_numeric_bins(data[selected_num])
-            temp = data.copy()
-            temp["range"] = binned
-
-            summary_num = (
-                temp.groupby("range")
-                .agg(
-                    on_time_percent=(TARGET_COLUMN, lambda x: x.mean() * 100),
-                    total_shipments=(TARGET_COLUMN, "size"),
-                )
-                .reset_index()
-                .dropna()
-            )
+            summary_num = _numeric_bin_summary(data, selected_num)
 
-            fig_num = px.bar(
-                summary_num,
-                x="range",
-                y="on_time_percent",
-                text_auto=".1f",
-                labels={
-                    "range": f"{selected_num} range",
-                    "on_time_percent": "On-time delivery rate (%)",
-                },
-            )
+            fig_num = _build_numeric_fig(summary_num, selected_num)
             st.plotly_chart(fig_num, use_container_width=True)
 
             st.caption(
@@ -204,33 +325,11 @@ def eda_page(data: pd.DataFrame) -> None:
     with tab_segments:
         st.subheader("Business segments: where do we perform well or poorly?")
 
-        grouping_column = st.selectbox(
-            "Group by",
-            ["Mode_of_Shipment", "Warehouse_block", "Product_importance", "Gender"],
-        )
+        grouping_column = st.selectbox("Group by", SEGMENT_COLUMNS)
 
-        summary = (
-            data.groupby(grouping_column)
-            .agg(
-                on_time_percent=(TARGET_COLUMN, lambda x: x.mean() * 100),
-                avg_cost=("Cost_of_the_Product", "mean"),
-                avg_discount=("Discount_offered", "mean"),
-            )
-            .reset_index()
-        )
+        summary = _all_segment_summaries(data)[grouping_column]
 
-        fig_segment = px.bar(
-            summary,
-            x=grouping_column,
-            y="on_time_percent",
-            text_auto=".1f",
-            color="avg_discount",
-            color_continuous_scale="Blues",
-            labels={
-                "on_time_percent": "On-time delivery rate (%)",
-                "avg_discount": "Average discount",
-            },
-        )
+        fig_segment = _build_segment_fig(summary, grouping_column)
         st.plotly_chart(fig_segment, use_container_width=True)
 
         st.dataframe(
@@ -1,14 +1,27 @@
+import logging
+import os
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
-import joblib
+import numpy as np
 import pandas as pd
 import streamlit as st
-from huggingface_hub import hf_hub_download
+
+# Use the multi-connection Xet transfer backend for model downloads. It is read
+# when huggingface_hub is imported (lazily, in load_model), so set it up front.
+os.environ.setdefault("HF_XET_HIGH_PERFORMANCE", "1")
+# Keep the Hub cache on the Space's persistent volume when one is mounted, so a
+# restarted container finds the model on disk instead of downloading it again.
+if os.access("/data", os.W_OK):
+    os.environ.setdefault("HF_HOME", "/data/hf_cache")
 
 # ==== Model configuration ====
 # Local path (used for CI tests & when you commit the artifact)
 LOCAL_MODEL_PATH = Path(__file__).resolve().parent / "best_model_pipeline.joblib"
+# Notebook export at the repository root (used for local dev from a checkout)
+REPO_MODEL_PATH = Path(__file__).resolve().parents[1] / "models" / "best_model_pipeline.joblib"
 
 # Model repo on Hugging Face Hub (fallback when local file is not available)
 MODEL_REPO_ID = "vorddd/shipping-delay-knn-v1"
@@ -23,40 +36,234 @@ FEATURE_ORDER = [
     "Product_importance",
 ]
 
+# Compact dtypes for the one-row inference frame (same widths as the dataset)
+FEATURE_DTYPES = {
+    "Customer_care_calls": "int8",
+    "Cost_of_the_Product": "int32",
+    "Prior_purchases": "int8",
+    "Discount_offered": "int16",
+    "Weight_in_gms": "int32",
+}
+
+
+logger = logging.getLogger(__name__)
+
+# Process-wide model instance, shared by every session once loaded
+_MODEL = None
+_FAST_PREDICT = None
+_MODEL_LOCK = threading.Lock()
+
 
-@st.cache_resource(show_spinner=False)
 def load_model():
     """
-    Load the trained model pipeline.
+    Load the trained model pipeline (once per process).
 
     Priority:
-    1. If LOCAL_MODEL_PATH exists -> use that (for unit tests & local dev).
-    2. Otherwise -> download from Hugging Face Hub (for Spaces).
+    1. If LOCAL_MODEL_PATH exists -> use that (for unit tests & baked images).
+    2. If REPO_MODEL_PATH exists -> use that (for local dev from a checkout).
+    3. Otherwise -> download from Hugging Face Hub (for Spaces).
+
+    After the first load this is a plain global lookup, which keeps the
+    per-submit call free of Streamlit's cache-key hashing. The lock makes
+    concurrent sessions on a cold start wait for a single load.
     """
-    if LOCAL_MODEL_PATH.exists():
-        model_path = LOCAL_MODEL_PATH
-    else:
-        model_path = hf_hub_download(
-            repo_id=MODEL_REPO_ID,
-            filename=MODEL_FILENAME,
-            repo_type="model",
-        )
+    global _MODEL, _FAST_PREDICT
+    if _MODEL is not None:
+        return _MODEL
+
+    with _MODEL_LOCK:
+        if _MODEL is None:
+            # Heavy imports are deferred to the first load (normally on the
+            # warm-up thread), so importing this module stays cheap.
+            import joblib
+
+            if LOCAL_MODEL_PATH.exists():
+                model_path = LOCAL_MODEL_PATH
+            elif REPO_MODEL_PATH.exists():
+                model_path = REPO_MODEL_PATH
+            else:
+                from huggingface_hub import hf_hub_download
+
+                model_path = hf_hub_download(
+                    repo_id=MODEL_REPO_ID,
+                    filename=MODEL_FILENAME,
+                    repo_type="model",
+                )
+
+            # Memory-map the stored arrays (the KNN reference set) instead of
+            # copying them into fresh buffers; they are only ever read.
+            model = joblib.load(model_path, mmap_mode="r")
+            _FAST_PREDICT = _compile_fast_predictor(model)
+            _predict_cached.cache_clear()
+            # Publish the model last: the lock-free check above must never see
+            # a loaded model whose fast predictor is not set yet.
+            _MODEL = model
+    return _MODEL
+
 
-    model = joblib.load(model_path)
-    return model
+_WARM_THREAD: Optional[threading.Thread] = None
+_WARM_FAILED = False
+
+
+def warm_model() -> None:
+    """
+    Start loading the model in a background thread if it is not loaded yet.
+
+    Called when the app starts so the download and ``joblib.load`` overlap with
+    the user reading the overview, instead of blocking the first prediction.
+    A failed warm-up is logged once and not retried here, so reruns do not
+    hammer the Hub; the next ``load_model()`` call on submit retries and
+    raises as usual.
+    """
+    global _WARM_THREAD
+    if (
+        _MODEL is not None
+        or _WARM_FAILED
+        or (_WARM_THREAD is not None and _WARM_THREAD.is_alive())
+    ):
+        return
+
+    def _warm() -> None:
+        global _WARM_FAILED
+        try:
+            load_model()
+        except Exception:
+            _WARM_FAILED = True
+            logger.exception("Background model warm-up failed")
+
+    _WARM_THREAD = threading.Thread(target=_warm, name="warm-model", daemon=True)
+    _WARM_THREAD.start()
+
+
+def _compile_fast_predictor(model) -> Optional[Callable[[tuple], Optional[int]]]:
+    """
+    Specialize the shipping pipeline into a single-row ``predict_fast(values)``.
+
+    The fitted ColumnTransformer is replaced by the MinMaxScaler arithmetic on a
+    NumPy row plus a lookup table of the OrdinalEncoder codes, and the final
+    estimator is called directly. Returns None when the pipeline does not have
+    the expected (MinMaxScaler, OrdinalEncoder) -> estimator layout, or when
+    the estimator's classes are not integers.
+    """
+    from sklearn.compose import ColumnTransformer
+    from sklearn.neighbors import KNeighborsClassifier
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import MinMaxScaler, OrdinalEncoder
+
+    def _unwrap(transformer):
+        if isinstance(transformer, Pipeline) and len(transformer.steps) == 1:
+            return transformer.steps[0][1]
+        return transformer
+
+    if not isinstance(model, Pipeline) or len(model.steps) != 2:
+        return None
+    preprocess, estimator = model[0], model[-1]
+    if not isinstance(preprocess, ColumnTransformer):
+        return None
+
+    fitted = {name: (_unwrap(t), cols) for name, t, cols in preprocess.transformers_}
+    scaler, numeric_cols = fitted.get("num", (None, None))
+    encoder, category_cols = fitted.get("cat", (None, None))
+    if (
+        not isinstance(scaler, MinMaxScaler)
+        or scaler.clip
+        or list(numeric_cols) != FEATURE_ORDER[:-1]
+        or not isinstance(encoder, OrdinalEncoder)
+        or list(category_cols) != FEATURE_ORDER[-1:]
+        or preprocess.output_indices_["num"] != slice(0, len(FEATURE_ORDER) - 1)
+    ):
+        return None
+
+    # predict_fast returns int labels; leave other class types to the pipeline.
+    classes = getattr(estimator, "classes_", None)
+    if classes is None or not np.issubdtype(np.asarray(classes).dtype, np.integer):
+        return None
+
+    scale, offset = scaler.scale_, scaler.min_
+    category_codes = {
+        category: float(code) for code, category in enumerate(encoder.categories_[0])
+    }
+    estimator_predict = estimator.predict
+
+    # For a uniform-weight KNN fitted with a KD/ball tree, query the tree
+    # directly and vote over neighbour labels, skipping predict()'s input
+    # validation. Ties resolve to the lowest class, as in sklearn.
+    if (
+        isinstance(estimator, KNeighborsClassifier)
+        and estimator.weights == "uniform"
+        and estimator._fit_method in ("kd_tree", "ball_tree")
+        and not estimator.outputs_2d_
+    ):
+        tree, labels, classes = estimator._tree, estimator._y, estimator.classes_
+        n_neighbors = estimator.n_neighbors
+
+        def estimator_predict(row):
+            _, indices = tree.query(row, k=n_neighbors)
+            votes = np.bincount(labels[indices[0]], minlength=len(classes))
+            return classes[[votes.argmax()]]
+
+    def predict_fast(values: tuple) -> Optional[int]:
+        code = category_codes.get(values[-1])
+        if code is None:
+            return None  # unknown category: let the full pipeline handle it
+        row = np.empty((1, len(FEATURE_ORDER)))
+        row[0, :-1] = values[:-1]
+        row[0, :-1] *= scale
+        row[0, :-1] += offset
+        row[0, -1] = code
+        return int(estimator_predict(row)[0])
+
+    return predict_fast
 
 
 def _get_feature_ranges(data: pd.DataFrame) -> dict:
     """Get min, max, median for numeric features to build friendly sliders."""
-    ranges = {}
-    for column in FEATURE_ORDER[:-1]:  # numeric only, last one is categorical
-        series = data[column]
-        ranges[column] = (
-            int(series.min()),
-            int(series.max()),
-            int(series.median()),
-        )
-    return ranges
+    columns = FEATURE_ORDER[:-1]  # numeric only, last one is categorical
+    stats = data[columns].agg(["min", "max", "median"]).to_numpy(dtype=np.int64)
+    # One tolist() call converts every value to a Python int for st.slider
+    return dict(zip(columns, map(tuple, stats.T.tolist())))
+
+
+def _get_category_options(series: pd.Series) -> list:
+    """Sorted distinct values, read from the categorical dtype when available."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.categories.tolist()
+    return np.unique(series.to_numpy()).tolist()
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _get_ui_metadata(data: pd.DataFrame) -> tuple[dict, tuple]:
+    """Slider ranges and product importance options, computed once per dataset."""
+    product_options = tuple(_get_category_options(data["Product_importance"]))
+    return _get_feature_ranges(data), product_options
+
+
+def _get_features_template(product_options: tuple) -> pd.DataFrame:
+    """One-row feature frame kept in the session and overwritten on each submit."""
+    template = st.session_state.get("features_template")
+    categories = list(product_options)
+    if template is None or template["Product_importance"].cat.categories.tolist() != categories:
+        columns = {
+            column: pd.array([0], dtype=dtype) for column, dtype in FEATURE_DTYPES.items()
+        }
+        columns["Product_importance"] = pd.Categorical(categories[:1], categories=categories)
+        template = pd.DataFrame(columns)
+        st.session_state["features_template"] = template
+    return template
+
+
+@lru_cache(maxsize=512)
+def _predict_cached(values: tuple) -> Optional[int]:
+    """
+    Fast-path prediction memoized in-process on the six form values.
+
+    Returns None when the loaded pipeline has no fast path (or the category is
+    unknown); the caller then runs the full pipeline on its feature frame.
+    """
+    load_model()
+    if _FAST_PREDICT is None:
+        return None
+    return _FAST_PREDICT(values)
 
 
 def model_page(reference_data: Optional[pd.DataFrame] = None) -> None:
@@ -72,11 +279,16 @@ def model_page(reference_data: Optional[pd.DataFrame] = None) -> None:
     )
 
     if reference_data is None:
-        raise ValueError("reference_data is required to build sensible input ranges")
+        from deployment.data import load_data
+
+        reference_data = load_data()
 
     # Build slider ranges from real data so the UI feels realistic
-    feature_ranges = _get_feature_ranges(reference_data)
-    product_options = sorted(reference_data["Product_importance"].unique())
+    feature_ranges, product_options = _get_ui_metadata(reference_data)
+
+    # Make sure the model is loading in the background; the form renders right
+    # away and a submit before the load finishes waits on it in load_model().
+    warm_model()
 
     with st.form("prediction_form"):
         st.subheader("Shipment details")
@@ -133,21 +345,22 @@ def model_page(reference_data: Optional[pd.DataFrame] = None) -> None:
         st.info("Fill in the shipment details and click **Predict shipment status**.")
         return
 
-    # Build feature vector in the same order used during training
-    features = pd.DataFrame(
-        [[
-            customer_care_calls,
-            cost_of_product,
-            prior_purchases,
-            discount_offered,
-            weight_in_gms,
-            product_importance,
-        ]],
-        columns=FEATURE_ORDER,
+    # Fill the feature vector in the same order used during training
+    features = _get_features_template(product_options)
+    values = (
+        customer_care_calls,
+        cost_of_product,
+        prior_purchases,
+        discount_offered,
+        weight_in_gms,
+        product_importance,
     )
+    for i, value in enumerate(values):
+        features.iat[0, i] = value
 
-    model = load_model()
-    prediction_raw = model.predict(features)[0]
+    prediction_raw = _predict_cached(values)
+    if prediction_raw is None:
+        prediction_raw = load_model().predict(features)[0]
     is_on_time = prediction_raw == 1
 
     st.subheader("Prediction result")
@@ -1,9 +1,10 @@
 from pathlib import Path
 
 import joblib
+import numpy as np
 import pandas as pd
 
-from deployment import prediction
+from deployment import eda, prediction
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 
@@ -20,7 +21,7 @@ def test_shipping_dataset_has_expected_columns():
     dataset_path = PROJECT_ROOT / "shipping.csv"
     assert dataset_path.exists(), "shipping.csv is missing from the repository"
 
-    data = pd.read_csv(dataset_path)
+    data = pd.read_csv(dataset_path, engine="pyarrow", dtype_backend="pyarrow")
     expected_columns = {
         "ID",
         "Warehouse_block",
@@ -52,8 +53,77 @@ def test_load_model_returns_predictable_estimator(monkeypatch, tmp_path):
         monkeypatch.setattr(prediction, "LOCAL_MODEL_PATH", dummy_path)
 
     # Ensure the cache does not return a stale object between tests.
-    if hasattr(prediction.load_model, "clear"):
-        prediction.load_model.clear()
+    monkeypatch.setattr(prediction, "_MODEL", None)
+    monkeypatch.setattr(prediction, "_FAST_PREDICT", None)
 
     model = prediction.load_model()
     assert hasattr(model, "predict"), "Model missing predict method"
+
+
+def test_warm_model_loads_in_background(monkeypatch, tmp_path):
+    dummy_path = tmp_path / "dummy_model.joblib"
+    joblib.dump(_DummyModel(), dummy_path)
+
+    monkeypatch.setattr(prediction, "LOCAL_MODEL_PATH", dummy_path)
+    monkeypatch.setattr(prediction, "_MODEL", None)
+    monkeypatch.setattr(prediction, "_FAST_PREDICT", None)
+    monkeypatch.setattr(prediction, "_WARM_THREAD", None)
+    monkeypatch.setattr(prediction, "_WARM_FAILED", False)
+
+    prediction.warm_model()
+    prediction._WARM_THREAD.join(timeout=30)
+
+    assert isinstance(prediction._MODEL, _DummyModel)
+
+
+def test_warm_model_does_not_retry_after_failure(monkeypatch, tmp_path):
+    broken_path = tmp_path / "broken_model.joblib"
+    broken_path.write_bytes(b"not a joblib file")
+
+    monkeypatch.setattr(prediction, "LOCAL_MODEL_PATH", broken_path)
+    monkeypatch.setattr(prediction, "_MODEL", None)
+    monkeypatch.setattr(prediction, "_FAST_PREDICT", None)
+    monkeypatch.setattr(prediction, "_WARM_THREAD", None)
+    monkeypatch.setattr(prediction, "_WARM_FAILED", False)
+
+    prediction.warm_model()
+    failed_thread = prediction._WARM_THREAD
+    failed_thread.join(timeout=30)
+
+    assert prediction._WARM_FAILED
+    prediction.warm_model()
+    assert prediction._WARM_THREAD is failed_thread
+
+
+def test_label_target_maps_unexpected_values_to_unknown():
+    data = pd.DataFrame({eda.TARGET_COLUMN: [1, 0, 1, 2]})
+
+    labels = eda._label_target(data)
+
+    assert labels.tolist() == ["On Time", "Late", "On Time", "Unknown"]
+    assert labels.cat.codes.dtype == "int8"
+
+
+def test_make_numeric_bins_matches_pd_cut():
+    series = pd.Series([0, 1, 2, 2.5, 7, 10])
+    bins = np.linspace(0, 10, 6)
+
+    expected = pd.cut(series, bins=bins, include_lowest=True).cat.codes
+
+    assert eda._make_numeric_bins(series).codes.tolist() == expected.tolist()
+
+
+def test_fast_predictor_matches_pipeline():
+    model = joblib.load(PROJECT_ROOT / "models" / "best_model_pipeline.joblib")
+    predict_fast = prediction._compile_fast_predictor(model)
+    assert predict_fast is not None, "Pipeline layout no longer supports the fast path"
+
+    features = pd.read_csv(PROJECT_ROOT / "shipping.csv")[prediction.FEATURE_ORDER].head(500)
+    fast = [predict_fast(tuple(row)) for row in features.itertuples(index=False)]
+
+    assert fast == model.predict(features).tolist()
+    assert prediction._compile_fast_predictor(_DummyModel()) is None
+
+    # String class labels are left to the full pipeline instead of int().
+    model[-1].classes_ = np.array(["Late", "On Time"])
+    assert prediction._compile_fast_predictor(model) is None